@@ -0,0 +1,96 @@
+"""
+Admission control for the scoring API.
+
+  - Coalescing: concurrent requests with the same key (canonical URL) share one
+    in-flight computation instead of each calling score().
+  - Bounded concurrency: at most `max_concurrency` computations run at once.
+  - Load shedding: a request that waits longer than `queue_timeout_ms` for a
+    slot is either rejected (Overloaded -> 503) or answered with a cheap
+    degraded result, depending on `overload_mode`.
+
+All state is touched only from the event loop thread; both the computation
+and the degraded fallback run in the threadpool, so the loop never blocks on
+scoring work (degrades happen exactly when the loop is busiest).
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+OVERLOAD_MODES = ("degrade", "reject")
+
+
+class Overloaded(Exception):
+    """Raised when a request is shed and no degraded result is available."""
+
+
+class AdmissionController:
+    def __init__(self, max_concurrency: int = 32, queue_timeout_ms: float = 100.0, overload_mode: str = "degrade") -> None:
+        if overload_mode not in OVERLOAD_MODES:
+            raise ValueError(f"overload_mode must be one of {OVERLOAD_MODES}, got {overload_mode!r}")
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout_ms / 1000.0
+        self.overload_mode = overload_mode
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.counters = {
+            "requests": 0,
+            "computed": 0,
+            "coalesced": 0,
+            "shed_degraded": 0,
+            "shed_rejected": 0,
+            "errors": 0,
+        }
+
+    def stats(self) -> dict:
+        return {
+            **self.counters,
+            "inflight_keys": len(self._inflight),
+            "max_concurrency": self.max_concurrency,
+            "queue_timeout_ms": self.queue_timeout * 1000.0,
+            "overload_mode": self.overload_mode,
+        }
+
+    async def submit(self, key: str, compute: Callable[[], dict], degrade: Callable[[], dict] | None = None) -> dict:
+        self.counters["requests"] += 1
+
+        leader = self._inflight.get(key)
+        if leader is not None:
+            self.counters["coalesced"] += 1
+            # shield: a cancelled follower must not cancel the shared computation
+            return await asyncio.shield(leader)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await self._admit(compute, degrade)
+            fut.set_result(result)
+            return result
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved; followers (if any) re-raise it themselves
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _admit(self, compute: Callable[[], dict], degrade: Callable[[], dict] | None) -> dict:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if self.overload_mode == "degrade" and degrade is not None:
+                self.counters["shed_degraded"] += 1
+                return await run_in_threadpool(degrade)
+            self.counters["shed_rejected"] += 1
+            raise Overloaded("Scoring capacity exhausted.")
+
+        try:
+            result = await run_in_threadpool(compute)
+            self.counters["computed"] += 1
+            return result
+        except Exception:
+            self.counters["errors"] += 1
+            raise
+        finally:
+            self._slots.release()
@@ -15,5 +15,13 @@ class Settings(BaseModel):
     app_name: str = os.getenv("APP_NAME", "URL Trust Scorer")
     model_path: str = os.getenv("MODEL_PATH", str(ARTIFACT_DIR / "model.joblib"))
 
+    # Skip the ML call when the heuristic rules alone settle the verdict
+    tiered_scoring: bool = os.getenv("SCORE_TIERED", "0").lower() in ("1", "true", "yes")
+
+    # Admission control for /score (see app/admission.py)
+    max_concurrency: int = int(os.getenv("SCORE_MAX_CONCURRENCY", "32"))
+    queue_timeout_ms: float = float(os.getenv("SCORE_QUEUE_TIMEOUT_MS", "100"))
+    overload_mode: str = os.getenv("SCORE_OVERLOAD_MODE", "degrade")  # "degrade" or "reject"
+
 
 settings = Settings()
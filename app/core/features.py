@@ -2,10 +2,9 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse, unquote
 
-import tldextract
-
 
 SUSPICIOUS_TOKENS = [
     "login", "verify", "update", "secure", "account", "bank", "signin",
@@ -16,6 +15,9 @@ SHORTENER_DOMAINS = {
     "bit.ly", "tinyurl.com", "t.co", "goo.gl", "ow.ly", "is.gd", "buff.ly"
 }
 
+# Max number of distinct hosts whose features are memoized (LRU eviction)
+HOST_CACHE_SIZE = 8192
+
 
 def _shannon_entropy(s: str) -> float:
     if not s:
@@ -63,26 +65,90 @@ class FeatureSpec:
 SPEC = FeatureSpec()
 
 
-def extract_features(url: str) -> dict[str, float]:
+@dataclass(frozen=True)
+class HostFeatures:
+    """Features that depend only on the URL's netloc (host[:port])."""
+    netloc: str
+    port: int | None
+    host_len: float
+    num_dots: float
+    has_ip_host: float
+    num_subdomains: float
+    tld_len: float
+    host_entropy: float
+    is_shortener: float
+
+
+@lru_cache(maxsize=HOST_CACHE_SIZE)
+def host_features(netloc: str) -> HostFeatures:
+    """
+    Compute (and memoize) the host-derived features for a lowercased netloc.
+    Many URLs share a host (CDN paths, URLhaus payloads on one IP), so the
+    tldextract lookup, entropy, etc. are only paid once per unique host.
+    """
+    # Imported lazily: tldextract (and requests) are only needed once a host is scored
+    import tldextract
+
+    host = netloc.lower()
+    hostname = host.split(":")[0]
+
+    ext = tldextract.extract(host)
+    registered = ".".join([p for p in [ext.domain, ext.suffix] if p])
+
+    # Port parsing mirrors urlparse(...).port, but an invalid port yields None
+    # instead of raising (feature extraction never depended on the port).
+    try:
+        port = urlparse("//" + host).port
+    except ValueError:
+        port = None
+
+    subdomain_part = ext.subdomain
+
+    return HostFeatures(
+        netloc=host,
+        port=port,
+        host_len=float(len(host)),
+        num_dots=float(host.count(".")),
+        has_ip_host=1.0 if re.fullmatch(r"\d{1,3}(\.\d{1,3}){3}", hostname) else 0.0,
+        num_subdomains=float(0 if not subdomain_part else len(subdomain_part.split("."))),
+        tld_len=float(len(ext.suffix or "")),
+        host_entropy=float(_shannon_entropy(host)),
+        is_shortener=1.0 if (registered in SHORTENER_DOMAINS) else 0.0,
+    )
+
+
+def host_cache_stats() -> dict:
+    """Hit/miss counters for the host feature cache."""
+    info = host_features.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": (info.hits / lookups) if lookups else 0.0,
+    }
+
+
+def url_features(url: str) -> tuple[dict[str, float], HostFeatures]:
+    """
+    Feature dict plus the HostFeatures it was built from, so callers that also
+    need the port (run_rules) reuse one host lookup per URL.
+    """
     url = url.strip()
     if not (url.startswith("http://") or url.startswith("https://")):
         # Treat missing scheme as http (common user input)
         url = "http://" + url
 
     parsed = urlparse(url)
-    host = (parsed.netloc or "").lower()
+    hf = host_features((parsed.netloc or "").lower())
     path = unquote(parsed.path or "")
     query = parsed.query or ""
 
-    ext = tldextract.extract(host)
-    registered = ".".join([p for p in [ext.domain, ext.suffix] if p])
-
     # Basic counts
     url_len = float(len(url))
-    host_len = float(len(host))
     path_len = float(len(path))
     query_len = float(len(query))
-    num_dots = float(host.count("."))
     num_digits = float(_count_regex(r"\d", url))
     num_special = float(_count_regex(r"[^A-Za-z0-9]", url))
     num_params = float(0 if not query else len(query.split("&")))
@@ -91,48 +157,43 @@ def extract_features(url: str) -> dict[str, float]:
     has_at_symbol = 1.0 if "@" in url else 0.0
     has_double_slash_in_path = 1.0 if "//" in (parsed.path or "") else 0.0
 
-    # IP host check
-    has_ip_host = 1.0 if re.fullmatch(r"\d{1,3}(\.\d{1,3}){3}", host.split(":")[0]) else 0.0
-
-    # Subdomains
-    subdomain_part = ext.subdomain
-    num_subdomains = float(0 if not subdomain_part else len(subdomain_part.split(".")))
-
-    tld_len = float(len(ext.suffix or ""))
-
-    host_entropy = float(_shannon_entropy(host))
     path_entropy = float(_shannon_entropy(path))
 
     lowered = url.lower()
     suspicious_token_count = float(sum(1 for tok in SUSPICIOUS_TOKENS if tok in lowered))
 
-    is_shortener = 1.0 if (registered in SHORTENER_DOMAINS) else 0.0
-
     feats = {
         "url_len": url_len,
-        "host_len": host_len,
+        "host_len": hf.host_len,
         "path_len": path_len,
         "query_len": query_len,
-        "num_dots": num_dots,
+        "num_dots": hf.num_dots,
         "num_digits": num_digits,
         "num_special": num_special,
         "num_params": num_params,
-        "has_ip_host": has_ip_host,
+        "has_ip_host": hf.has_ip_host,
         "uses_https": uses_https,
         "has_at_symbol": has_at_symbol,
         "has_double_slash_in_path": has_double_slash_in_path,
-        "num_subdomains": num_subdomains,
-        "tld_len": tld_len,
-        "host_entropy": host_entropy,
+        "num_subdomains": hf.num_subdomains,
+        "tld_len": hf.tld_len,
+        "host_entropy": hf.host_entropy,
         "path_entropy": path_entropy,
         "suspicious_token_count": suspicious_token_count,
-        "is_shortener": is_shortener,
+        "is_shortener": hf.is_shortener,
     }
 
     # Ensure spec completeness + order
-    return {name: float(feats.get(name, 0.0)) for name in SPEC.names}
+    return {name: float(feats.get(name, 0.0)) for name in SPEC.names}, hf
+
+
+def extract_features(url: str) -> dict[str, float]:
+    return url_features(url)[0]
+
+
+def to_vector(feats: dict[str, float]) -> list[float]:
+    return [feats[name] for name in SPEC.names]
 
 
 def vectorize(url: str) -> list[float]:
-    f = extract_features(url)
-    return [f[name] for name in SPEC.names]
+    return to_vector(extract_features(url))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_left
+from pathlib import Path
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class LiteCalibratedLR:
+    """
+    Pure-Python inference for the calibrated logistic regression exported by
+    ml/export_model.py. Mirrors sklearn's CalibratedClassifierCV.predict_proba
+    (StandardScaler -> LR decision function -> isotonic calibration, averaged
+    over CV folds) without importing sklearn or numpy.
+    """
+
+    def __init__(self, folds: list[dict], source_sha256: str | None = None) -> None:
+        self.folds = folds
+        # sha256 of the model.joblib this was exported from (staleness check)
+        self.source_sha256 = source_sha256
+
+    @classmethod
+    def load(cls, path: Path, feature_names: tuple[str, ...]) -> "LiteCalibratedLR":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if tuple(data["feature_names"]) != tuple(feature_names):
+            raise ValueError(f"Feature spec mismatch in {path}; re-export with: python -m ml.export_model")
+        return cls(data["folds"], data.get("source_sha256"))
+
+    def predict_malicious(self, rows: list[list[float]]) -> list[float]:
+        return [self._predict_one(row) for row in rows]
+
+    def _predict_one(self, row: list[float]) -> float:
+        total = 0.0
+        for fold in self.folds:
+            decision = fold["intercept"]
+            for x, mean, scale, coef in zip(row, fold["mean"], fold["scale"], fold["coef"]):
+                decision += coef * ((x - mean) / scale)
+            p = _isotonic(decision, fold["iso_x"], fold["iso_y"])
+            if 1.0 < p <= 1.0 + 1e-5:
+                p = 1.0
+            total += p
+        return total / len(self.folds)
+
+
+def _isotonic(t: float, xs: list[float], ys: list[float]) -> float:
+    # IsotonicRegression(out_of_bounds="clip") with linear interpolation
+    if len(xs) == 1:
+        return ys[0]
+    t = min(max(t, xs[0]), xs[-1])
+    hi = min(max(bisect_left(xs, t), 1), len(xs) - 1)
+    lo = hi - 1
+    slope = (ys[hi] - ys[lo]) / (xs[hi] - xs[lo])
+    return slope * (t - xs[lo]) + ys[lo]
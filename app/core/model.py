@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import logging
+import threading
+import time
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
-import joblib
-import numpy as np
-
-from .features import vectorize, SPEC
+from .features import vectorize, to_vector, url_features, SPEC
+from .lite_model import LiteCalibratedLR, file_sha256
 from .rules import heuristic_risk
 
+logger = logging.getLogger(__name__)
+
 ARTIFACT_DIR = Path(__file__).resolve().parents[2] / "ml" / "artifacts"
 MODEL_PATH = ARTIFACT_DIR / "model.joblib"
+# Plain-JSON export of MODEL_PATH (python -m ml.export_model); lets serving skip sklearn
+LITE_MODEL_PATH = ARTIFACT_DIR / "model_lite.json"
+
+# Weighted blend: tune later
+ML_WEIGHT = 0.30
+HEURISTIC_WEIGHT = 0.70
+
+# ML risk assumed for the reported score when the heuristic tier settles the verdict
+ML_PRIOR = 0.5
 
 
 def canonicalize_url(url: str) -> str:
@@ -59,51 +71,192 @@ def canonicalize_url(url: str) -> str:
 
 
 class URLTrustModel:
-    def __init__(self) -> None:
-        if not MODEL_PATH.exists():
-            raise FileNotFoundError(
-                f"Model not found at {MODEL_PATH}. Train it first: python -m ml.train"
-            )
-        self.model = joblib.load(MODEL_PATH)
+    def __init__(self, tiered: bool = False) -> None:
+        """
+        tiered=True runs the cheap rules first and only calls the ML model when
+        the verdict still depends on it (see settled_verdict()).
+        """
+        self.model = _load_backend()
+        self.tiered = tiered
+
+        self._tier_lock = threading.Lock()
+        self._tier_counts = {"heuristic": 0, "ml": 0}
+        self._ml_seconds = 0.0
 
     def predict_proba_malicious(self, url: str) -> float:
-        x = np.array([vectorize(url)], dtype=float)
-        # binary classifier expects [p(0), p(1)]
-        proba = self.model.predict_proba(x)[0, 1]
-        return float(proba)
+        return float(self.model.predict_malicious([vectorize(url)])[0])
 
     def score(self, url: str) -> dict:
         url_input = url
         url = canonicalize_url(url)
 
-        ml_risk = self.predict_proba_malicious(url)  # 0..1
-        heur_risk, hits = heuristic_risk(url)
+        # One feature extraction (and host lookup) shared by rules and model
+        feats, host = url_features(url)
+        heur_risk, hits = heuristic_risk(url, feats, host)
+        if self.tiered and settled_verdict(heur_risk) is not None:
+            self._record_tiers(heuristic=1)
+            return _build_result(url_input, url, None, heur_risk, hits, tier="heuristic")
+
+        t0 = time.perf_counter()
+        ml_risk = float(self.model.predict_malicious([to_vector(feats)])[0])  # 0..1
+        self._record_tiers(ml=1, ml_seconds=time.perf_counter() - t0)
+
+        return _build_result(url_input, url, ml_risk, heur_risk, hits)
 
-        # Weighted blend: tune later
-        final_risk = 0.30 * ml_risk + 0.70 * heur_risk
-        final_risk = max(0.0, min(1.0, final_risk))
+    def score_batch(self, urls: list[str]) -> list[dict]:
+        """
+        Score many URLs with a single predict_proba call.
+        Results match score() per URL (up to float rounding in the ML probability).
+        """
+        if not urls:
+            return []
+        canonical = [canonicalize_url(u) for u in urls]
+        features = [url_features(u) for u in canonical]
+        heuristics = [heuristic_risk(u, feats, host) for u, (feats, host) in zip(canonical, features)]
 
-        trust_score = int(round(100 * (1.0 - final_risk)))
+        need_ml = [
+            i for i, (heur_risk, _) in enumerate(heuristics)
+            if not self.tiered or settled_verdict(heur_risk) is None
+        ]
+        ml_risks: dict[int, float] = {}
+        if need_ml:
+            t0 = time.perf_counter()
+            probas = self.model.predict_malicious([to_vector(features[i][0]) for i in need_ml])
+            ml_risks = {i: float(p) for i, p in zip(need_ml, probas)}
+            self._record_tiers(ml=len(need_ml), ml_seconds=time.perf_counter() - t0)
+        self._record_tiers(heuristic=len(urls) - len(need_ml))
 
-        if trust_score >= 70:
-            verdict = "SAFE"
-        elif trust_score >= 40:
-            verdict = "SUSPICIOUS"
-        else:
-            verdict = "DANGEROUS"
+        results = []
+        for i, (url_input, url, (heur_risk, hits)) in enumerate(zip(urls, canonical, heuristics)):
+            if i in ml_risks:
+                results.append(_build_result(url_input, url, ml_risks[i], heur_risk, hits))
+            else:
+                results.append(_build_result(url_input, url, None, heur_risk, hits, tier="heuristic"))
+        return results
 
-        reasons = [{"code": h.code, "points": h.points, "message": h.message} for h in hits]
+    def _record_tiers(self, heuristic: int = 0, ml: int = 0, ml_seconds: float = 0.0) -> None:
+        with self._tier_lock:
+            self._tier_counts["heuristic"] += heuristic
+            self._tier_counts["ml"] += ml
+            self._ml_seconds += ml_seconds
 
+    def tier_stats(self) -> dict:
+        """How often each tier was taken, and the ML time the heuristic tier avoided."""
+        with self._tier_lock:
+            fast = self._tier_counts["heuristic"]
+            slow = self._tier_counts["ml"]
+            ml_seconds = self._ml_seconds
+        total = fast + slow
+        avg_ml_ms = 1000.0 * ml_seconds / slow if slow else 0.0
         return {
-            "url_input": url_input,  # what the user/tab provided
-            "url": url,              # canonical URL that was actually scored
-            "trust_score": trust_score,
-            "verdict": verdict,
-            "risk": {
-                "final": final_risk,
-                "ml": ml_risk,
-                "heuristic": heur_risk,
-            },
-            "feature_names": list(SPEC.names),
-            "reasons": reasons,
+            "tiered": self.tiered,
+            "heuristic": fast,
+            "ml": slow,
+            "heuristic_rate": fast / total if total else 0.0,
+            "avg_ml_ms": avg_ml_ms,
+            "est_saved_ms": fast * avg_ml_ms,
         }
+
+
+class _SklearnBackend:
+    """Fallback when no (up-to-date) lite export exists; pulls in joblib/numpy/sklearn on load."""
+
+    def __init__(self, path: Path) -> None:
+        import joblib
+
+        self.model = joblib.load(path)
+
+    def predict_malicious(self, rows: list[list[float]]) -> list[float]:
+        import numpy as np
+
+        # binary classifier expects [p(0), p(1)]
+        return self.model.predict_proba(np.array(rows, dtype=float))[:, 1].tolist()
+
+
+def _load_backend():
+    if LITE_MODEL_PATH.exists():
+        lite = LiteCalibratedLR.load(LITE_MODEL_PATH, SPEC.names)
+        if not MODEL_PATH.exists() or lite.source_sha256 == file_sha256(MODEL_PATH):
+            logger.info("Loaded lite model backend from %s", LITE_MODEL_PATH)
+            return lite
+        # model.joblib was replaced/retrained without re-exporting: don't serve old weights
+        logger.warning(
+            "%s does not match %s (stale export); falling back to sklearn. "
+            "Re-export with: python -m ml.export_model",
+            LITE_MODEL_PATH, MODEL_PATH,
+        )
+    if MODEL_PATH.exists():
+        logger.info("Loaded sklearn model backend from %s", MODEL_PATH)
+        return _SklearnBackend(MODEL_PATH)
+    raise FileNotFoundError(
+        f"Model not found at {MODEL_PATH}. Train it first: python -m ml.train"
+    )
+
+
+def score_heuristic_only(url: str) -> dict:
+    """
+    Degraded score from the rule engine alone (no model call).
+    Used when the API sheds load; risk["ml"] is None and "degraded" is True.
+    """
+    url_input = url
+    url = canonicalize_url(url)
+    heur_risk, hits = heuristic_risk(url)
+    return _build_result(url_input, url, None, heur_risk, hits, tier="degraded")
+
+
+def _blend(ml_risk: float, heur_risk: float) -> float:
+    final_risk = ML_WEIGHT * ml_risk + HEURISTIC_WEIGHT * heur_risk
+    return max(0.0, min(1.0, final_risk))
+
+
+def _trust_score(final_risk: float) -> int:
+    return int(round(100 * (1.0 - final_risk)))
+
+
+def _verdict(trust_score: int) -> str:
+    if trust_score >= 70:
+        return "SAFE"
+    elif trust_score >= 40:
+        return "SUSPICIOUS"
+    return "DANGEROUS"
+
+
+def settled_verdict(heur_risk: float) -> str | None:
+    """
+    Return the verdict if it is the same for every ML risk in [0, 1], else None.
+    The blend, rounding and thresholds are all monotone in ml_risk, so checking
+    the two extremes covers every value in between.
+    """
+    lo = _verdict(_trust_score(_blend(0.0, heur_risk)))
+    hi = _verdict(_trust_score(_blend(1.0, heur_risk)))
+    return lo if lo == hi else None
+
+
+def _build_result(url_input: str, url: str, ml_risk: float | None, heur_risk: float, hits: list, tier: str = "ml") -> dict:
+    if tier == "degraded":
+        final_risk = max(0.0, min(1.0, heur_risk))
+    elif tier == "heuristic":
+        final_risk = _blend(ML_PRIOR, heur_risk)  # verdict is settled; ML_PRIOR only positions the score
+    else:
+        final_risk = _blend(ml_risk, heur_risk)
+
+    trust_score = _trust_score(final_risk)
+    verdict = _verdict(trust_score)
+
+    reasons = [{"code": h.code, "points": h.points, "message": h.message} for h in hits]
+
+    return {
+        "url_input": url_input,  # what the user/tab provided
+        "url": url,              # canonical URL that was actually scored
+        "trust_score": trust_score,
+        "verdict": verdict,
+        "risk": {
+            "final": final_risk,
+            "ml": ml_risk,
+            "heuristic": heur_risk,
+        },
+        "feature_names": list(SPEC.names),
+        "reasons": reasons,
+        "tier": tier,
+        "degraded": tier == "degraded",
+    }
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
-from .features import extract_features
+from .features import HostFeatures, host_features, url_features
 
 
 @dataclass(frozen=True)
@@ -28,14 +28,23 @@ def _path_has_suspicious_extension(path: str) -> bool:
     return any(p.endswith(ext) for ext in SUSPICIOUS_EXTS)
 
 
-def run_rules(url: str) -> list[RuleHit]:
+def run_rules(url: str, feats: dict[str, float] | None = None, host: HostFeatures | None = None) -> list[RuleHit]:
+    """
+    Pass `feats`/`host` from url_features() when the caller already has them,
+    so scoring a URL costs a single host feature lookup.
+    """
     hits: list[RuleHit] = []
-    feats = extract_features(url)
+    if feats is None or host is None:
+        feats, host = url_features(url)
 
     parsed = urlparse(url if "://" in url else "http://" + url)
-    host = (parsed.hostname or "").lower()
     path = parsed.path or ""
-    port = parsed.port
+    netloc = (parsed.netloc or "").lower()
+    # Port comes from the cached host features; only look up again if this
+    # parse saw a different netloc (e.g. a non-http scheme)
+    if host.netloc != netloc:
+        host = host_features(netloc)
+    port = host.port
 
     # 1) IP as host (strong indicator)
     if feats.get("has_ip_host", 0.0) == 1.0:
@@ -91,8 +100,8 @@ def run_rules(url: str) -> list[RuleHit]:
     return hits
 
 
-def heuristic_risk(url: str) -> tuple[float, list[RuleHit]]:
-    hits = run_rules(url)
+def heuristic_risk(url: str, feats: dict[str, float] | None = None, host: HostFeatures | None = None) -> tuple[float, list[RuleHit]]:
+    hits = run_rules(url, feats, host)
     points = sum(h.points for h in hits)
 
     # Convert points -> risk. Using /100 makes "100 points = max risk".
@@ -1,8 +1,11 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
+from .config import settings
 from .schemas import ScoreRequest, ScoreResponse
-from .core.model import URLTrustModel
+from .admission import AdmissionController, Overloaded
+from .core.model import URLTrustModel, canonicalize_url, score_heuristic_only
+from .core.features import host_cache_stats
 
 app = FastAPI(title="URL Trust Scorer", version="0.1")
 
@@ -16,12 +19,18 @@ app.add_middleware(
 )
 
 _model: URLTrustModel | None = None  # global variable that later becomes the model instance
+_admission: AdmissionController | None = None
 
 
 @app.on_event("startup")
 def load_model() -> None:
-    global _model
-    _model = URLTrustModel()  # create model instance once at server startup
+    global _model, _admission
+    _model = URLTrustModel(tiered=settings.tiered_scoring)  # create model instance once at server startup
+    _admission = AdmissionController(
+        max_concurrency=settings.max_concurrency,
+        queue_timeout_ms=settings.queue_timeout_ms,
+        overload_mode=settings.overload_mode,
+    )
 
 
 # Check if server is running (sanity check)
@@ -30,8 +39,30 @@ def health():
     return {"ok": True}
 
 
+# Runtime counters (cache effectiveness etc.)
+@app.get("/stats")
+def stats():
+    out = {"host_cache": host_cache_stats()}
+    if _model is not None:
+        out["tiers"] = _model.tier_stats()
+    if _admission is not None:
+        out["admission"] = _admission.stats()
+    return out
+
+
 @app.post("/score", response_model=ScoreResponse)
-def score(req: ScoreRequest):
-    if _model is None:
+async def score(req: ScoreRequest):
+    if _model is None or _admission is None:
         raise HTTPException(status_code=500, detail="Model not loaded.")
-    return _model.score(req.url)
+
+    # Identical canonical URLs arriving concurrently share one computation
+    model = _model
+    try:
+        result = await _admission.submit(
+            canonicalize_url(req.url),
+            lambda: model.score(req.url),
+            degrade=lambda: score_heuristic_only(req.url),
+        )
+    except Overloaded:
+        raise HTTPException(status_code=503, detail="Server overloaded, retry later.", headers={"Retry-After": "1"})
+    return result
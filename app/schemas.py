@@ -12,3 +12,5 @@ class ScoreResponse(BaseModel):
     risk: dict
     reasons: list[dict]
     feature_names: list[str]
+    tier: str = "ml"  # "ml", "heuristic" (verdict settled without the model) or "degraded"
+    degraded: bool = False  # True when scored by heuristics only (load shedding)
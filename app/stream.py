@@ -0,0 +1,191 @@
+"""
+Binary streaming front end for URLTrustModel (alternative to the HTTP /score route).
+
+Wire protocol (TCP, one persistent connection carries many requests):
+  request frame  : 4-byte big-endian length + UTF-8 URL
+  response frame : 4-byte big-endian length + UTF-8 JSON (same shape as /score,
+                   or {"error": "..."} if the URL could not be scored)
+
+Responses on a connection come back in request order, so clients may pipeline.
+Requests from all connections are batched into a single score_batch() call.
+Backpressure: each connection has a bounded in-flight window and the shared
+batch queue is bounded; when either is full the server stops reading from the
+socket, which pushes back on the client through TCP flow control.
+
+Run:
+  python -m app.stream --port 9000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import struct
+
+from .core.model import URLTrustModel, canonicalize_url
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024  # URLs are short; reject anything absurd
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes | None:
+    """Read one length-prefixed frame; None on clean EOF."""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame too large ({length} bytes).")
+    return await reader.readexactly(length)
+
+
+def encode_frame(payload: bytes) -> bytes:
+    return HEADER.pack(len(payload)) + payload
+
+
+class StreamScorer:
+    def __init__(
+        self,
+        model: URLTrustModel,
+        max_batch: int = 64,
+        max_wait_ms: float = 2.0,
+        queue_size: int = 1024,
+        window: int = 128,
+    ) -> None:
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.window = window
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.stats = {"connections": 0, "requests": 0, "batches": 0, "errors": 0}
+
+    async def batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self.queue.get()]
+            if self.max_wait > 0 and self.queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.max_wait)  # let a batch accumulate
+            while len(items) < self.max_batch and not self.queue.empty():
+                items.append(self.queue.get_nowait())
+
+            # Reject unparseable URLs up front so they don't break batching for the rest
+            valid = []
+            for url, fut in items:
+                try:
+                    canonicalize_url(url)
+                except ValueError as e:
+                    self.stats["errors"] += 1
+                    fut.set_result({"url_input": url, "error": str(e)})
+                else:
+                    valid.append((url, fut))
+            if not valid:
+                continue
+
+            urls = [url for url, _ in valid]
+            try:
+                results = await loop.run_in_executor(None, self.model.score_batch, urls)
+            except Exception:
+                # Unexpected failure: fall back to one by one so only the culprit errors
+                results = await loop.run_in_executor(None, self._score_each, urls)
+
+            self.stats["batches"] += 1
+            for (_, fut), res in zip(valid, results):
+                if not fut.done():
+                    fut.set_result(res)
+
+    def _score_each(self, urls: list[str]) -> list[dict]:
+        results = []
+        for url in urls:
+            try:
+                results.append(self.model.score(url))
+            except Exception as e:
+                self.stats["errors"] += 1
+                results.append({"url_input": url, "error": str(e)})
+        return results
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["connections"] += 1
+        # Bounded per-connection window of pending responses (in request order)
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.window)
+        sender = asyncio.create_task(self._send_loop(pending, writer))
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                fut = loop.create_future()
+                await pending.put(fut)
+                self.stats["requests"] += 1
+                await self.queue.put((frame.decode("utf-8", errors="replace"), fut))
+        except ValueError as e:
+            # Oversized frame: tell the client why before closing
+            self.stats["errors"] += 1
+            fut = loop.create_future()
+            fut.set_result({"error": str(e)})
+            await pending.put(fut)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await pending.put(None)  # sentinel: flush remaining responses, then close
+            await sender
+
+    async def _send_loop(self, pending: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        broken = False
+        while True:
+            fut = await pending.get()
+            if fut is None:
+                break
+            res = await fut
+            if broken:
+                continue  # keep draining so the reader never blocks on a dead peer
+            try:
+                writer.write(encode_frame(json.dumps(res).encode("utf-8")))
+                await writer.drain()
+            except ConnectionError:
+                broken = True
+        writer.close()
+
+
+async def serve(host: str, port: int, scorer: StreamScorer) -> None:
+    batcher = asyncio.create_task(scorer.batch_loop())
+    server = await asyncio.start_server(scorer.handle, host, port)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Streaming scorer listening on {addrs}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batcher.cancel()
+        print(f"Streaming scorer stats: {json.dumps(scorer.stats)}")
+        print(f"Tier stats: {json.dumps(scorer.model.tier_stats())}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Binary streaming URL Trust Scorer.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9000, help="Bind port (default: 9000)")
+    parser.add_argument("--max-batch", type=int, default=64, help="Max URLs per model call (default: 64)")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Max time to fill a batch (default: 2ms)")
+    parser.add_argument("--queue-size", type=int, default=1024, help="Shared pending-URL queue bound (default: 1024)")
+    parser.add_argument("--window", type=int, default=128, help="Max in-flight requests per connection (default: 128)")
+    parser.add_argument("--tiered", action="store_true", help="Skip the ML call when heuristics settle the verdict")
+    args = parser.parse_args()
+
+    scorer = StreamScorer(
+        URLTrustModel(tiered=args.tiered),
+        max_batch=args.max_batch,
+        max_wait_ms=args.max_wait_ms,
+        queue_size=args.queue_size,
+        window=args.window,
+    )
+    try:
+        asyncio.run(serve(args.host, args.port, scorer))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
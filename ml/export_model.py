@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+import json
+
+import joblib
+
+from app.core.features import SPEC
+from app.core.lite_model import file_sha256
+
+
+ML_DIR = Path(__file__).resolve().parent
+ARTIFACT_DIR = ML_DIR / "artifacts"
+MODEL_PATH = ARTIFACT_DIR / "model.joblib"
+LITE_MODEL_PATH = ARTIFACT_DIR / "model_lite.json"
+
+
+def export_lite(model, path: Path = LITE_MODEL_PATH, source_path: Path = MODEL_PATH) -> None:
+    """
+    Dump the calibrated scaler + logistic regression as plain JSON so the API can
+    score without importing sklearn/numpy (see app/core/lite_model.py).
+
+    Supports CalibratedClassifierCV(Pipeline([StandardScaler, LogisticRegression]),
+    method="isotonic") as built by ml/train.py. The sha256 of `source_path`
+    (the saved model.joblib) is recorded so serving can detect a stale export.
+    """
+    if list(model.classes_) != [0, 1]:
+        raise ValueError(f"Expected binary classes [0, 1], got {list(model.classes_)}")
+    if model.method != "isotonic":
+        raise ValueError(f"Only isotonic calibration is supported, got {model.method!r}")
+
+    folds = []
+    for cc in model.calibrated_classifiers_:
+        scaler = cc.estimator.named_steps["scaler"]
+        lr = cc.estimator.named_steps["lr"]
+        (iso,) = cc.calibrators
+        folds.append(
+            {
+                "mean": scaler.mean_.tolist(),
+                "scale": scaler.scale_.tolist(),
+                "coef": lr.coef_[0].tolist(),
+                "intercept": float(lr.intercept_[0]),
+                "iso_x": iso.X_thresholds_.tolist(),
+                "iso_y": iso.y_thresholds_.tolist(),
+            }
+        )
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"feature_names": list(SPEC.names), "source_sha256": file_sha256(source_path), "folds": folds},
+            f,
+        )
+
+
+def main() -> None:
+    if not MODEL_PATH.exists():
+        raise FileNotFoundError(f"Model not found at {MODEL_PATH}. Train first: python -m ml.train")
+
+    export_lite(joblib.load(MODEL_PATH))
+    print("Saved lite model ->", LITE_MODEL_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.calibration import CalibratedClassifierCV
 
 from app.core.features import vectorize, SPEC
+from ml.export_model import export_lite, LITE_MODEL_PATH
 
 
 ML_DIR = Path(__file__).resolve().parent
@@ -120,11 +121,13 @@ def main() -> None:
 
     # Save artifacts
     joblib.dump(model, MODEL_PATH)
+    export_lite(model, LITE_MODEL_PATH, MODEL_PATH)
 
     with open(SPEC_PATH, "w", encoding="utf-8") as f:
         json.dump({"feature_names": list(SPEC.names)}, f, indent=2)
 
     print("\nSaved model ->", MODEL_PATH)
+    print("Saved lite model ->", LITE_MODEL_PATH)
     print("Saved feature spec ->", SPEC_PATH)
 
 
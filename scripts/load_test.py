@@ -0,0 +1,254 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import psutil
+
+from loadgen_common import DATA_PATH, latency_summary, load_urls
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def url_mix(pool: list[str], n: int, repeat_ratio: float, seed: int) -> list[str]:
+    """
+    Sample `n` URLs from `pool`. With probability `repeat_ratio` a request reuses a
+    URL already sent (campaign-style duplicates); otherwise it takes a fresh one.
+    """
+    rng = random.Random(seed)
+    fresh = pool[:]
+    rng.shuffle(fresh)
+    sent: list[str] = []
+    out = []
+    for _ in range(n):
+        if sent and rng.random() < repeat_ratio:
+            url = rng.choice(sent)
+        else:
+            url = fresh[len(sent) % len(fresh)]
+            sent.append(url)
+        out.append(url)
+    return out
+
+
+class ServerProbe:
+    """
+    CPU time and RSS of the process serving requests (None if unknown).
+    `label` is the report key: "server", or "client_and_server" when the app
+    runs in-process and the numbers include the load generator itself.
+    """
+
+    def __init__(self, pid: int | None, label: str = "server") -> None:
+        self.label = label
+        self.proc = psutil.Process(pid) if pid else None
+        self.cpu_start = self._cpu()
+        self.rss_peak = 0
+
+    def _cpu(self) -> float:
+        if self.proc is None:
+            return 0.0
+        t = self.proc.cpu_times()
+        return t.user + t.system
+
+    async def sample(self, interval: float = 0.1) -> None:
+        while self.proc is not None:
+            self.rss_peak = max(self.rss_peak, self.proc.memory_info().rss)
+            await asyncio.sleep(interval)
+
+    def report(self, elapsed: float) -> dict | None:
+        if self.proc is None:
+            return None
+        cpu = self._cpu() - self.cpu_start
+        rss = self.proc.memory_info().rss
+        return {
+            "pid": self.proc.pid,
+            "cpu_seconds": cpu,
+            "cpu_percent": 100.0 * cpu / elapsed if elapsed else 0.0,
+            "rss_mb": rss / 2**20,
+            "rss_peak_mb": max(self.rss_peak, rss) / 2**20,
+        }
+
+
+async def warmup(client: httpx.AsyncClient, urls: list[str], concurrency: int, timeout: float) -> None:
+    """Send unmeasured requests so cold-start costs (lazy imports, caches) stay out of the stats."""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> None:
+        async with slots:
+            try:
+                await client.post("/score", json={"url": url}, timeout=timeout)
+            except httpx.HTTPError:
+                pass
+
+    await asyncio.gather(*(one(u) for u in urls))
+
+
+async def drive(client: httpx.AsyncClient, urls: list[str], warmup_urls: list[str], args: argparse.Namespace,
+                pid: int | None, probe_label: str) -> dict:
+    rate, concurrency, timeout = args.rate, args.concurrency, args.timeout
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    tiers: Counter = Counter()
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(url: str, scheduled: float) -> None:
+        try:
+            r = await client.post("/score", json={"url": url}, timeout=timeout)
+            if r.status_code == 200:
+                tier = r.json().get("tier", "ml")
+                tiers[tier] += 1
+            statuses[str(r.status_code)] += 1
+        except httpx.HTTPError as e:
+            statuses[type(e).__name__] += 1
+        except ValueError:
+            statuses["invalid_json"] += 1  # 200 with a non-JSON body
+        finally:
+            slots.release()
+        # Open loop measures from the scheduled arrival, so waiting for a free
+        # slot counts toward latency (avoids coordinated omission)
+        latencies.append(time.perf_counter() - scheduled)
+
+    if warmup_urls:
+        await warmup(client, warmup_urls, concurrency, timeout)
+
+    probe = ServerProbe(pid, probe_label)  # baseline taken after warmup
+    sampler = asyncio.create_task(probe.sample())
+    t0 = time.perf_counter()
+    tasks = []
+    for i, url in enumerate(urls):
+        if rate > 0:
+            scheduled = t0 + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+        else:
+            await slots.acquire()  # closed loop: keep `concurrency` requests in flight
+            scheduled = time.perf_counter()
+        tasks.append(asyncio.create_task(one(url, scheduled)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+    sampler.cancel()
+
+    # Server-side counters (admission, host cache, tiers) after the run; includes warmup
+    try:
+        stats = (await client.get("/stats", timeout=timeout)).json()
+    except (httpx.HTTPError, ValueError):
+        stats = None
+
+    ok = statuses.get("200", 0)
+    report = {
+        "requests": len(urls),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(urls) / elapsed if elapsed else 0.0,
+        "error_rate": 1.0 - ok / len(urls) if urls else 0.0,
+        "status_counts": dict(statuses),
+        "tier_counts": dict(tiers),
+        "latency_ms": latency_summary(latencies),
+        "server": None,
+    }
+    report[probe.label] = probe.report(elapsed)
+    report["server_stats"] = stats
+    return report
+
+
+async def run_asgi(args: argparse.Namespace, urls: list[str], warmup_urls: list[str]) -> dict:
+    sys.path.insert(0, str(ROOT))
+    from app.main import app
+
+    await app.router.startup()  # ASGITransport does not send lifespan events
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            # Same process as the load generator: CPU/RSS are client + server combined
+            return await drive(client, urls, warmup_urls, args, os.getpid(), "client_and_server")
+    finally:
+        await app.router.shutdown()
+
+
+async def run_http(args: argparse.Namespace, urls: list[str], warmup_urls: list[str], base_url: str, pid: int | None) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        return await drive(client, urls, warmup_urls, args, pid, "server")
+
+
+async def wait_healthy(base_url: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.05)
+    raise TimeoutError(f"Server at {base_url} not healthy after {timeout}s")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    pool = load_urls(Path(args.data))
+    urls = url_mix(pool, args.requests, args.repeat_ratio, args.seed)
+    # Separate sample so warmup doesn't pre-seed the measured mix's repeats
+    warmup_urls = url_mix(pool, args.warmup, 0.0, args.seed + 1)
+
+    if args.mode == "asgi":
+        result = await run_asgi(args, urls, warmup_urls)
+    elif args.mode == "uvicorn":
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+            cwd=ROOT,
+        )
+        base_url = f"http://127.0.0.1:{args.port}"
+        try:
+            await wait_healthy(base_url, 60.0)
+            result = await run_http(args, urls, warmup_urls, base_url, server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+    else:
+        result = await run_http(args, urls, warmup_urls, args.base_url, args.server_pid)
+
+    result["config"] = {
+        "mode": args.mode,
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+        "repeat_ratio": args.repeat_ratio,
+        "warmup": args.warmup,
+        "seed": args.seed,
+    }
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Async load generator for the URL Trust Scorer /score route.")
+    parser.add_argument("--mode", choices=("asgi", "uvicorn", "url"), default="asgi",
+                        help="asgi: in-process app; uvicorn: spawn a local server; url: existing server at --base-url (default: asgi)")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server for --mode url (default: http://127.0.0.1:8000)")
+    parser.add_argument("--server-pid", type=int, help="PID to sample CPU/RSS from in --mode url")
+    parser.add_argument("--port", type=int, default=8766, help="Port for --mode uvicorn (default: 8766)")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests (default: 2000)")
+    parser.add_argument("--rate", type=float, default=0.0, help="Open-loop arrival rate in req/s; 0 = closed loop (default: 0)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Max requests in flight (default: 32)")
+    parser.add_argument("--repeat-ratio", type=float, default=0.2, help="Fraction of requests that repeat an earlier URL (default: 0.2)")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests sent first to absorb cold start; 0 disables (default: 100)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Per-request timeout in seconds (default: 10)")
+    parser.add_argument("--data", default=str(DATA_PATH), help="CSV with a 'url' column (default: ml/data/urls.csv)")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed (default: 0)")
+    parser.add_argument("--out", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    print(report)
+    if args.out:
+        Path(args.out).write_text(report + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Helpers shared by the load generators (load_test.py, stream_load.py)."""
+from __future__ import annotations
+import csv
+from pathlib import Path
+
+DATA_PATH = Path(__file__).resolve().parents[1] / "ml" / "data" / "urls.csv"
+
+
+def load_urls(path: Path = DATA_PATH) -> list[str]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return [row["url"] for row in csv.DictReader(f) if row.get("url")]
+
+
+def percentile(sorted_vals: list[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = min(len(sorted_vals) - 1, int(round(q * (len(sorted_vals) - 1))))
+    return sorted_vals[idx]
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    """p50/p95/p99/max in milliseconds from latencies in seconds."""
+    lat = sorted(latencies)
+    return {
+        "p50": 1000 * percentile(lat, 0.50),
+        "p95": 1000 * percentile(lat, 0.95),
+        "p99": 1000 * percentile(lat, 0.99),
+        "max": 1000 * (lat[-1] if lat else 0.0),
+    }
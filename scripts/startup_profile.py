@@ -0,0 +1,103 @@
+from __future__ import annotations
+import argparse
+import json
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+# Modules that should stay off the serving path (training/unpickling only)
+HEAVY_MODULES = ("pandas", "sklearn", "scipy", "numpy", "joblib")
+
+
+def profile_imports(module: str) -> dict:
+    """Run `python -X importtime -c 'import <module>'` and parse the per-module timings."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({"module": name.strip(), "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+
+    names = {r["module"] for r in rows}
+    total = next((r["cumulative_ms"] for r in rows if r["module"] == module), 0.0)
+    return {"total_ms": total, "modules": rows, "heavy_imported": [m for m in HEAVY_MODULES if m in names]}
+
+
+def heavy_after_first_score(url: str) -> list[str]:
+    """
+    Heavy modules loaded once the app has started and served one /score.
+    Importing app.main alone is not enough: the model backend loads at startup.
+    """
+    code = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from app.main import app\n"
+        "with TestClient(app) as c:\n"
+        f"    c.post('/score', json={{'url': {url!r}}}).raise_for_status()\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [m for m in proc.stdout.strip().split(",") if m]
+
+
+def time_to_first_score(port: int, url: str, timeout_s: float) -> float:
+    """Seconds from spawning uvicorn until POST /score first succeeds."""
+    body = json.dumps({"url": url}).encode("utf-8")
+    endpoint = f"http://127.0.0.1:{port}/score"
+
+    t0 = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    try:
+        while time.perf_counter() - t0 < timeout_s:
+            req = urllib.request.Request(endpoint, data=body, headers={"Content-Type": "application/json"})
+            try:
+                with urllib.request.urlopen(req, timeout=5) as r:
+                    if r.status == 200:
+                        return time.perf_counter() - t0
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"/score did not answer within {timeout_s}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile API cold start: per-module import time and time to first /score.")
+    parser.add_argument("--module", default="app.main", help="Module to import-profile (default: app.main)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list (default: 15)")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the temporary uvicorn server (default: 8765)")
+    parser.add_argument("--url", default="https://example.com", help="URL sent to /score (default: https://example.com)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for the first /score (default: 60)")
+    parser.add_argument("--skip-server", action="store_true", help="Only profile imports (skip the first-/score checks)")
+    args = parser.parse_args()
+
+    imports = profile_imports(args.module)
+    report = {
+        "module": args.module,
+        "import_total_ms": imports["total_ms"],
+        "heavy_imported": imports["heavy_imported"],
+        "slowest_self_ms": sorted(imports["modules"], key=lambda r: r["self_ms"], reverse=True)[: args.top],
+    }
+    if not args.skip_server:
+        report["heavy_after_first_score"] = heavy_after_first_score(args.url)
+        report["time_to_first_score_ms"] = 1000 * time_to_first_score(args.port, args.url, args.timeout)
+
+    print(json.dumps(report, indent=2))
+    if report["heavy_imported"] or report.get("heavy_after_first_score"):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
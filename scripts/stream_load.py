@@ -0,0 +1,85 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import random
+import struct
+import time
+from pathlib import Path
+
+from loadgen_common import DATA_PATH, latency_summary, load_urls
+
+HEADER = struct.Struct(">I")
+
+
+async def run_connection(host: str, port: int, urls: list[str], window: int, latencies: list[float]) -> int:
+    """Pipeline `urls` over one connection with at most `window` requests in flight."""
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(window)
+    errors = 0
+
+    async def send() -> None:
+        for url in urls:
+            await slots.acquire()
+            data = url.encode("utf-8")
+            await sent_at.put(time.perf_counter())
+            writer.write(HEADER.pack(len(data)) + data)
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in urls:
+        (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+        res = json.loads(await reader.readexactly(length))
+        latencies.append(time.perf_counter() - await sent_at.get())
+        if "error" in res:
+            errors += 1
+        slots.release()
+
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+
+async def run(args: argparse.Namespace) -> dict:
+    pool = load_urls(Path(args.data))
+    rng = random.Random(args.seed)
+    urls = [rng.choice(pool) for _ in range(args.requests)]
+    # Round-robin the URL list across connections
+    shards = [urls[i::args.connections] for i in range(args.connections)]
+    latencies: list[float] = []
+
+    t0 = time.perf_counter()
+    errors = await asyncio.gather(
+        *(run_connection(args.host, args.port, shard, args.window, latencies) for shard in shards)
+    )
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "requests": len(latencies),
+        "connections": args.connections,
+        "window": args.window,
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "errors": sum(errors),
+        "latency_ms": latency_summary(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load generator for the binary streaming scorer (python -m app.stream).")
+    parser.add_argument("--host", default="127.0.0.1", help="Server host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9000, help="Server port (default: 9000)")
+    parser.add_argument("--requests", type=int, default=10000, help="Total URLs to send (default: 10000)")
+    parser.add_argument("--connections", type=int, default=4, help="Persistent connections (default: 4)")
+    parser.add_argument("--window", type=int, default=64, help="In-flight requests per connection (default: 64)")
+    parser.add_argument("--data", default=str(DATA_PATH), help="CSV with a 'url' column (default: ml/data/urls.csv)")
+    parser.add_argument("--seed", type=int, default=0, help="Sampling seed (default: 0)")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.admission import AdmissionController, Overloaded
+from app.core.model import score_heuristic_only
+from app.main import app
+
+
+def test_concurrent_identical_keys_share_one_computation():
+    calls = []
+    release = threading.Event()
+
+    def compute() -> dict:
+        calls.append(1)
+        release.wait(5)
+        return {"trust_score": 42}
+
+    async def run():
+        ac = AdmissionController(max_concurrency=4, queue_timeout_ms=1000)
+        tasks = [asyncio.create_task(ac.submit("http://a.com/", compute)) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return ac, await asyncio.gather(*tasks)
+
+    ac, results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r == {"trust_score": 42} for r in results)
+    assert ac.counters["computed"] == 1
+    assert ac.counters["coalesced"] == 9
+
+
+@pytest.mark.parametrize("mode", ["degrade", "reject"])
+def test_queue_timeout_sheds_load(mode):
+    release = threading.Event()
+
+    def slow() -> dict:
+        release.wait(5)
+        return {"degraded": False}
+
+    async def run():
+        loop_thread = threading.get_ident()
+        ac = AdmissionController(max_concurrency=1, queue_timeout_ms=20, overload_mode=mode)
+        busy = asyncio.create_task(ac.submit("http://a.com/", slow))
+        await asyncio.sleep(0.01)
+        try:
+            degrade = lambda: {"degraded": True, "on_loop_thread": threading.get_ident() == loop_thread}
+            return ac, await ac.submit("http://b.com/", slow, degrade=degrade)
+        finally:
+            release.set()
+            await busy
+
+    if mode == "degrade":
+        ac, res = asyncio.run(run())
+        assert res == {"degraded": True, "on_loop_thread": False}
+    else:
+        with pytest.raises(Overloaded):
+            asyncio.run(run())
+
+
+def test_heuristic_only_score_is_flagged_degraded():
+    res = score_heuristic_only("http://1.2.3.4/a.sh")
+    assert res["degraded"] is True
+    assert res["risk"]["ml"] is None
+    assert res["verdict"] == "DANGEROUS"
+
+
+def test_score_endpoint_reports_admission_counters():
+    with TestClient(app) as client:
+        r = client.post("/score", json={"url": "https://example.com"})
+        assert r.status_code == 200
+        assert r.json()["degraded"] is False
+
+        stats = client.get("/stats").json()
+        assert stats["admission"]["computed"] >= 1
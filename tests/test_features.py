@@ -1,5 +1,5 @@
 from __future__ import annotations
-from app.core.features import extract_features, vectorize, SPEC
+from app.core.features import extract_features, vectorize, SPEC, host_features, host_cache_stats
 from urllib.parse import urlparse, urlunparse
 
 def canonicalize_url(url: str) -> str:
@@ -42,3 +42,37 @@ def test_basic_flags():
     feats = extract_features(url)
     assert feats["has_ip_host"] in (0.0, 1.0)
     assert feats["has_at_symbol"] in (0.0, 1.0)
+
+
+def test_host_features_are_cached_per_host():
+    host_features.cache_clear()
+    a = extract_features("https://cdn.example.com/a/b.js")
+    b = extract_features("https://cdn.example.com/other?q=1")
+
+    stats = host_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 0.5
+    for k in ("host_len", "num_dots", "num_subdomains", "tld_len", "host_entropy"):
+        assert a[k] == b[k]
+
+
+def test_host_features_port_and_ip():
+    hf = host_features("177.70.102.228:8080")
+    assert hf.has_ip_host == 1.0
+    assert hf.port == 8080
+    assert host_features("example.com:notaport").port is None
+
+
+def test_host_cache_hit_rate_counts_one_lookup_per_scored_url():
+    from app.core.model import URLTrustModel
+
+    model = URLTrustModel()
+    host_features.cache_clear()
+    for i in range(100):
+        model.score(f"http://host{i}.example.org/login")
+
+    stats = host_cache_stats()
+    assert stats["misses"] == 100
+    assert stats["hits"] == 0
+    assert stats["hit_rate"] == 0.0
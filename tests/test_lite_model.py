@@ -0,0 +1,63 @@
+from __future__ import annotations
+import csv
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from app.core.features import vectorize, SPEC
+from app.core.lite_model import LiteCalibratedLR
+from app.core.model import LITE_MODEL_PATH, MODEL_PATH
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_lite_model_matches_sklearn():
+    with open(ROOT / "ml" / "data" / "urls.csv", newline="", encoding="utf-8") as f:
+        urls = [row["url"] for row in csv.DictReader(f)][:5000]
+    rows = [vectorize(u) for u in urls]
+
+    expected = joblib.load(MODEL_PATH).predict_proba(np.array(rows, dtype=float))[:, 1]
+    got = LiteCalibratedLR.load(LITE_MODEL_PATH, SPEC.names).predict_malicious(rows)
+
+    assert np.allclose(got, expected, rtol=0, atol=1e-9)
+
+
+def test_serving_path_skips_heavy_modules():
+    # Startup loads the model backend, so check after startup and a first /score
+    code = (
+        "import sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "from app.main import app\n"
+        "with TestClient(app) as c:\n"
+        "    assert c.post('/score', json={'url': 'https://example.com'}).status_code == 200\n"
+        "print(','.join(m for m in ('pandas', 'sklearn', 'numpy') if m in sys.modules))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_stale_lite_export_falls_back_to_sklearn(tmp_path, monkeypatch, caplog):
+    from app.core import model as model_mod
+
+    stale = json.loads(LITE_MODEL_PATH.read_text(encoding="utf-8"))
+    stale["source_sha256"] = "0" * 64
+    stale_path = tmp_path / "model_lite.json"
+    stale_path.write_text(json.dumps(stale), encoding="utf-8")
+    monkeypatch.setattr(model_mod, "LITE_MODEL_PATH", stale_path)
+
+    with caplog.at_level(logging.WARNING):
+        backend = model_mod._load_backend()
+
+    assert isinstance(backend, model_mod._SklearnBackend)
+    assert "stale export" in caplog.text
+
+
+def test_current_lite_export_is_used():
+    from app.core import model as model_mod
+
+    assert isinstance(model_mod._load_backend(), LiteCalibratedLR)
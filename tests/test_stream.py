@@ -0,0 +1,97 @@
+from __future__ import annotations
+import asyncio
+import json
+
+from app.core.model import URLTrustModel
+from app.stream import HEADER, MAX_FRAME_BYTES, StreamScorer, encode_frame
+
+URLS = [
+    "https://example.com/help",
+    "http://177.70.102.228:8080/TmpFTP/info.zip",
+    "http://bad:port/",  # invalid port -> error frame, connection stays usable
+    "example.com/login",
+]
+
+
+async def _roundtrip(scorer: StreamScorer, urls: list[str]) -> list[dict]:
+    batcher = asyncio.create_task(scorer.batch_loop())
+    server = await asyncio.start_server(scorer.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for url in urls:  # pipeline everything before reading
+        writer.write(encode_frame(url.encode("utf-8")))
+    await writer.drain()
+
+    out = []
+    for _ in urls:
+        (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+        out.append(json.loads(await reader.readexactly(length)))
+
+    writer.close()
+    server.close()
+    await server.wait_closed()
+    batcher.cancel()
+    return out
+
+
+def test_stream_matches_score_in_order():
+    model = URLTrustModel()
+    scorer = StreamScorer(model, max_batch=8, window=2)
+    results = asyncio.run(_roundtrip(scorer, URLS))
+
+    assert [r["url_input"] for r in results] == URLS
+    assert "error" in results[2]
+    for url, res in zip(URLS, results):
+        if "error" in res:
+            continue
+        expected = model.score(url)
+        assert res["trust_score"] == expected["trust_score"]
+        assert res["verdict"] == expected["verdict"]
+
+
+class _CountingModel:
+    def __init__(self, model: URLTrustModel) -> None:
+        self.model = model
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def score_batch(self, urls):
+        self.batch_calls += 1
+        return self.model.score_batch(urls)
+
+    def score(self, url):
+        self.single_calls += 1
+        return self.model.score(url)
+
+
+def test_invalid_url_does_not_break_batching():
+    model = _CountingModel(URLTrustModel())
+    scorer = StreamScorer(model, max_batch=64, max_wait_ms=20)
+    results = asyncio.run(_roundtrip(scorer, URLS))
+
+    assert "error" in results[2]
+    assert model.single_calls == 0
+    assert model.batch_calls == 1
+
+
+def test_oversized_frame_gets_error_frame():
+    async def run():
+        scorer = StreamScorer(URLTrustModel())
+        batcher = asyncio.create_task(scorer.batch_loop())
+        server = await asyncio.start_server(scorer.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(HEADER.pack(MAX_FRAME_BYTES + 1))
+        await writer.drain()
+        (length,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+        res = json.loads(await reader.readexactly(length))
+
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        batcher.cancel()
+        return res
+
+    assert "too large" in asyncio.run(run())["error"]
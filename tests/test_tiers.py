@@ -0,0 +1,49 @@
+from __future__ import annotations
+import csv
+from pathlib import Path
+
+from app.core.model import (
+    URLTrustModel, _blend, _trust_score, _verdict, settled_verdict,
+)
+
+DATA_PATH = Path(__file__).resolve().parents[1] / "ml" / "data" / "urls.csv"
+
+
+def test_settled_verdict_holds_for_every_ml_risk():
+    # Heuristic risk is min(1, points / 100) with integer rule points
+    for points in range(0, 301):
+        heur = min(1.0, points / 100.0)
+        settled = settled_verdict(heur)
+        if settled is None:
+            continue
+        for i in range(0, 1001):
+            ml = i / 1000.0
+            assert _verdict(_trust_score(_blend(ml, heur))) == settled
+
+
+def test_saturated_heuristics_skip_ml():
+    # ip_host (55) + suspicious_ext (35) + no_https (15) >= 100 points
+    model = URLTrustModel(tiered=True)
+    res = model.score("http://1.2.3.4/payload.sh")
+    assert res["tier"] == "heuristic"
+    assert res["risk"]["ml"] is None
+    assert res["verdict"] == "DANGEROUS"
+    assert model.tier_stats()["heuristic"] == 1
+
+
+def test_tiered_verdicts_match_full_scoring_on_dataset():
+    with open(DATA_PATH, newline="", encoding="utf-8") as f:
+        urls = [row["url"] for row in csv.DictReader(f)]
+
+    full = URLTrustModel().score_batch(urls)
+    tiered_model = URLTrustModel(tiered=True)
+    tiered = tiered_model.score_batch(urls)
+
+    assert [r["verdict"] for r in tiered] == [r["verdict"] for r in full]
+    stats = tiered_model.tier_stats()
+    assert stats["heuristic"] + stats["ml"] == len(urls)
+    assert stats["heuristic"] > 0
+
+    # single-URL path agrees with the batch path
+    for url, expected in zip(urls[:200], full[:200]):
+        assert tiered_model.score(url)["verdict"] == expected["verdict"]